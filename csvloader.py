@@ -1,9 +1,34 @@
 import csv
+import datetime
+import decimal
+import functools
+import io
 import logging
+import mmap
 import os
+import queue
 import re
-import tempfile
-from psycopg2 import connect
+import threading
+from psycopg2 import connect, sql
+
+try:
+    # optional - only required by CsvLoader.load_data_binary
+    import psycopg
+    import psycopg.sql
+except ImportError:
+    psycopg = None
+
+try:
+    # optional - only required by CsvLoader.load_data_arrow
+    import adbc_driver_postgresql.dbapi
+    import pyarrow
+    import pyarrow.csv
+except ImportError:
+    adbc_driver_postgresql = None
+    pyarrow = None
+
+_LOG = logging.getLogger('CsvLoader')
+
 
 class CsvLoader(object):
     """
@@ -19,19 +44,81 @@ class CsvLoader(object):
     DEFAULT_DOUBLE_QUOTE = True
     DEFAULT_DATA_TYPE = "varchar"
 
-    CREATE_STMT = "CREATE TABLE IF NOT EXISTS {} ({});"
-    COPY_STMT = "COPY {} ({}) FROM stdin WITH CSV HEADER DELIMITER '{}' QUOTE '{}' ESCAPE '{}'"
-
-    def __init__(self, connection_string): 
+    LOCK_STMT = "SELECT pg_advisory_xact_lock(hashtext(%s));"
+    EXISTS_STMT = "SELECT to_regclass(%s) IS NOT NULL;"
+    CREATE_STMT = sql.SQL("CREATE {unlogged}TABLE IF NOT EXISTS {table} ({columns});")
+    COPY_STMT = sql.SQL("COPY {table} ({columns}) FROM stdin WITH (FORMAT csv, "
+                        "DELIMITER {delimiter}, QUOTE {quote}, ESCAPE {escape}{freeze})")
+    # composed with psycopg 3 by load_data_binary
+    COPY_BINARY_STMT = "COPY {table} ({columns}) FROM stdin WITH (FORMAT binary)"
+
+    # Postgres type names, without type modifiers, and their names in the psycopg 3 types registry
+    _BINARY_TYPE_NAMES = {
+        "smallint": "int2",
+        "int2": "int2",
+        "integer": "int4",
+        "int": "int4",
+        "int4": "int4",
+        "bigint": "int8",
+        "int8": "int8",
+        "numeric": "numeric",
+        "decimal": "numeric",
+        "real": "float4",
+        "float4": "float4",
+        "double precision": "float8",
+        "float8": "float8",
+        "date": "date",
+        "character varying": "varchar",
+        "varchar": "varchar",
+        "text": "text",
+    }
+
+    # converters from CSV values to the Python types dumped by the binary dumper of each type - binary COPY
+    # sends every value with its column type's binary dumper, so only types listed here can be loaded
+    _BINARY_CONVERTERS = {
+        "int2": int,
+        "int4": int,
+        "int8": int,
+        "numeric": decimal.Decimal,
+        "float4": float,
+        "float8": float,
+        "date": lambda value: datetime.datetime.strptime(value, "%Y-%m-%d").date(),
+        "varchar": str,
+        "text": str,
+    }
+
+    # size of the blocks read from the CSV file while correcting invalid characters and copying to the database
+    CHUNK_SIZE = 1 << 20
+
+    # size of the start of the CSV file checked for invalid characters before the whole file is checked
+    PROBE_SIZE = 4 << 20
+
+    # number of corrected blocks queued ahead of the copy to the database
+    QUEUE_SIZE = 4
+
+    # size of the blocks parsed in parallel by load_data_arrow
+    ARROW_BLOCK_SIZE = 8 << 20
+
+    # byte translation table used to correct invalid characters: 0xc9 -> 'e', everything else unchanged
+    _TRANSLATE = bytes(i if i != 0xc9 else 0x65 for i in range(256))
+
+    # patterns used to simplify column and table names
+    _CAMEL = re.compile(r'([a-z0-9])([A-Z])')
+    _NON_ALNUM = re.compile(r'[^0-9a-zA-Z]+')
+
+    def __init__(self, connection_string, table_prefix=DEFAULT_TABLE_PREFIX):
         """
         Constructs document with given database details.
         :param logger: the system logger 
         :param connection_string: database connection_string 
+        :param table_prefix: prefix of the table names generated from CSV file names
         """
         self._connection_string = connection_string
+        self._table_prefix = table_prefix
 
     def load_data(self, file_path, table_name=None, delimiter=DEFAULT_DELIMITER, quote_char=DEFAULT_QUOTE_CHAR,
-                  escape_char=DEFAULT_ESCAPE_CHAR, create_table=True, encoding="utf-8", work_file_prefix="out_"):
+                  escape_char=DEFAULT_ESCAPE_CHAR, create_table=True, encoding="utf-8", work_file_prefix="out_",
+                  unlogged=False):
         """
         Loads data from CSV file to the database.
         Table column names are based on CSV header and names are simplified:
@@ -45,85 +132,256 @@ class CsvLoader(object):
         :param escape_char: a one-character string used by the writer to escape the delimiter
         :param create_table: if True, table will be created
         :param encoding file encoding
+        :param work_file_prefix: no longer used - invalid characters are corrected while the file is copied
+        :param unlogged: if True, the table is created as UNLOGGED - it will be lost if the server crashes!
         """
         # doublequote=True by default
         # don't define escape char if it's the same as quote char
         escape_char = None if (escape_char == quote_char) else escape_char
 
-        original_headers = self._read_headers(file_path, delimiter, quote_char, escape_char, encoding)
+        original_headers, header_size = self._read_headers(file_path, delimiter, quote_char, escape_char, encoding)
 
         headers = self._normalize_headers(original_headers)
 
         if table_name == None:
            table_name = self._generate_table_name(file_path)
-           logging.getLogger('CsvLoader').info('Generated table name "{}"...'.format(table_name))
+           _LOG.info('Generated table name "{}"...'.format(table_name))
 
-        logging.getLogger('CsvLoader').info('Connecting to database ...')
+        _LOG.info('Connecting to database ...')
 
         connection = connect(self._connection_string)
 
-        if create_table:
-            logging.getLogger('CsvLoader').info('Creating table "{}"...'.format(table_name))
-            self._create_table(connection, headers, table_name)
-        
-        logging.getLogger('CsvLoader').info('Correcting file "{}"...'.format(file_path))
-        work_file = self._remove_invalid_characters(file_path, work_file_prefix)
+        # close the connection even if the load fails, so failed files don't leave connections behind
+        try:
+            # the table is created and loaded in one transaction: a table created by it can be
+            # loaded with COPY FREEZE, which skips setting hint bits and vacuuming the rows later
+            created = False
+
+            if create_table:
+                _LOG.info('Creating table "{}"...'.format(table_name))
+                created = self._create_table(connection, headers, table_name, unlogged)
+
+            _LOG.info('Loading data to table "{}"...'.format(table_name))
+            csv_stream = self._remove_invalid_characters(file_path, header_size)
+            self._copy_from_csv(connection, csv_stream, file_path, table_name, headers, delimiter, quote_char, escape_char, encoding,
+                                freeze=created)
+
+            _LOG.info('Finished loading to table "{}", closing connection.'.format(table_name))
+        finally:
+            connection.close()
+
+    def load_data_binary(self, file_path, column_types, table_name=None, delimiter=DEFAULT_DELIMITER,
+                         quote_char=DEFAULT_QUOTE_CHAR, escape_char=DEFAULT_ESCAPE_CHAR, create_table=True,
+                         encoding="utf-8", unlogged=False):
+        """
+        Loads data from CSV file to the database using binary COPY with typed columns.
+        Values are converted to their column types before they are sent, so the server
+        doesn't parse any text. Requires psycopg 3 (pip install "psycopg[binary]>=3.1").
+        Table and column names are generated as for load_data.
+        Unlike load_data, every empty value is loaded as NULL: the csv reader can't tell a quoted
+        empty value ("") from a missing one, so an empty varchar or text value is NULL too, where
+        a CSV COPY would load it as an empty string.
+        :param file_path: path to a CSV file
+        :param column_types: dictionary of simplified column names and Postgres types,
+        e.g. {"latitude": "numeric(10,8)"} - other columns are varchar. Integer, numeric, floating point, date,
+        varchar and text types are supported, with or without type modifiers
+        :param table_name: a table name
+        :param delimiter: a one-character string used to separate fields. It defaults to ','
+        :param quote_char: a one-character string used to quote fields containing special characters,
+        such as the delimiter or quotechar, or which contain new-line characters
+        :param escape_char: a one-character string used by the writer to escape the delimiter
+        :param create_table: if True, table will be created
+        :param encoding file encoding - characters that can't be decoded are replaced
+        :param unlogged: if True, the table is created as UNLOGGED - it will be lost if the server crashes!
+        """
+        if psycopg is None:
+            raise ImportError('load_data_binary requires psycopg 3 - pip install "psycopg[binary]>=3.1"')
+
+        escape_char = None if (escape_char == quote_char) else escape_char
+
+        original_headers, header_size = self._read_headers(file_path, delimiter, quote_char, escape_char, encoding)
+
+        headers = self._normalize_headers(original_headers)
+        types = [column_types.get(header, self.DEFAULT_DATA_TYPE) for header in headers]
+        # checked before connecting, so an unsupported type doesn't fail part way through the file
+        copy_types = [self._binary_copy_type(data_type) for data_type in types]
+
+        if table_name == None:
+           table_name = self._generate_table_name(file_path)
+           _LOG.info('Generated table name "{}"...'.format(table_name))
+
+        _LOG.info('Connecting to database ...')
+
+        connection = psycopg.connect(self._connection_string)
+
+        try:
+            if create_table:
+                _LOG.info('Creating table "{}"...'.format(table_name))
+                self._create_typed_table(connection, headers, types, table_name, unlogged)
 
-        logging.getLogger('CsvLoader').info('Loading data to table "{}"...'.format(table_name))
-        self._copy_from_csv(connection, work_file, file_path, table_name, headers, delimiter, quote_char, escape_char, encoding)
+            _LOG.info('Loading data to table "{}"...'.format(table_name))
+            csv_stream = self._remove_invalid_characters(file_path, header_size)
+            self._copy_binary_from_csv(connection, csv_stream, file_path, table_name, headers, copy_types, delimiter,
+                                       quote_char, escape_char, encoding)
 
-        logging.getLogger('CsvLoader').info('Finished loading to table "{}", closing connection.'.format(table_name))
-        connection.close()
-        os.remove(work_file)
+            _LOG.info('Finished loading to table "{}", closing connection.'.format(table_name))
+        finally:
+            connection.close()
+
+    def load_data_arrow(self, file_path, column_types=None, table_name=None, delimiter=DEFAULT_DELIMITER,
+                        quote_char=DEFAULT_QUOTE_CHAR, escape_char=DEFAULT_ESCAPE_CHAR, create_table=True,
+                        encoding="utf-8"):
+        """
+        Loads data from CSV file to the database using Arrow: the file is parsed in parallel blocks
+        by pyarrow and streamed to the database by ADBC, so no row is handled in Python.
+        Requires pyarrow and the ADBC Postgres driver (pip install pyarrow "adbc_driver_postgresql>=0.7").
+        Table and column names are generated as for load_data.
+        :param file_path: path to a CSV file
+        :param column_types: dictionary of simplified column names and Arrow types,
+        e.g. {"latitude": pyarrow.float64()} - other columns are strings
+        :param table_name: a table name
+        :param delimiter: a one-character string used to separate fields. It defaults to ','
+        :param quote_char: a one-character string used to quote fields containing special characters,
+        such as the delimiter or quotechar, or which contain new-line characters
+        :param escape_char: a one-character string used by the writer to escape the delimiter
+        :param create_table: if True, table will be created from the Arrow schema
+        :param encoding file encoding
+        """
+        if pyarrow is None:
+            raise ImportError('load_data_arrow requires pyarrow and ADBC - pip install pyarrow "adbc_driver_postgresql>=0.7"')
+
+        escape_char = None if (escape_char == quote_char) else escape_char
+
+        original_headers, header_size = self._read_headers(file_path, delimiter, quote_char, escape_char, encoding)
+
+        headers = self._normalize_headers(original_headers)
+
+        if table_name == None:
+           table_name = self._generate_table_name(file_path)
+           _LOG.info('Generated table name "{}"...'.format(table_name))
+
+        # columns aren't inferred - inference only sees the first block and would drop leading zeros from codes
+        column_types = column_types or {}
+        read_options = pyarrow.csv.ReadOptions(column_names=headers, use_threads=True,
+                                               block_size=self.ARROW_BLOCK_SIZE, encoding=encoding)
+        parse_options = pyarrow.csv.ParseOptions(delimiter=delimiter, quote_char=quote_char or False,
+                                                 escape_char=escape_char or False, double_quote=self.DEFAULT_DOUBLE_QUOTE)
+        # empty values are NULL and quoted empty values ("") are empty strings, as they are for a CSV COPY
+        convert_options = pyarrow.csv.ConvertOptions(
+            column_types={header: column_types.get(header, pyarrow.string()) for header in headers},
+            strings_can_be_null=True, quoted_strings_can_be_null=False)
+
+        schema_name, _, name = table_name.rpartition(".")
+
+        _LOG.info('Connecting to database ...')
+
+        with adbc_driver_postgresql.dbapi.connect(self._connection_string) as connection:
+            _LOG.info('Loading data to table "{}"...'.format(table_name))
+
+            with self._remove_invalid_characters(file_path, header_size) as csv_stream:
+                batches = pyarrow.csv.open_csv(csv_stream, read_options=read_options, parse_options=parse_options,
+                                               convert_options=convert_options)
+
+                with connection.cursor() as cursor:
+                    cursor.adbc_ingest(name, batches, mode="create_append" if create_table else "append",
+                                       db_schema_name=schema_name or None)
+                connection.commit()
+
+            _LOG.info('Finished loading to table "{}", closing connection.'.format(table_name))
 
     def _read_headers(self, file_path, delimiter=DEFAULT_DELIMITER, quote_char=DEFAULT_QUOTE_CHAR,
                       escape_char=DEFAULT_ESCAPE_CHAR, encoding="utf-8"):
         """
-        Reads CSV header and provides a list of columns.
+        Reads CSV header and provides a list of columns, and the size of the header record,
+        so the data can be read from after the header without parsing it again.
         :param file_path: path to a CSV file
         :param delimiter: a one-character string used to separate fields. It defaults to ','
         :param quote_char: a one-character string used to quote fields containing special characters,
         such as the delimiter or quotechar, or which contain new-line characters
         :param escape_char: a one-character string used by the writer to escape the delimiter
         :param encoding file encoding
-        :return: list of CSV columns
+        :return: list of CSV columns, size of the header record in bytes
         """
-        with open(file_path, "r", encoding=encoding) as csv_file:
-            reader = csv.reader(csv_file, delimiter=delimiter, quotechar=quote_char, escapechar=escape_char)
+        header_size = 0
+
+        def header_lines(csv_file):
+            # the csv reader takes one line at a time until the header record is complete - a quoted
+            # header with a new line spans several lines - so the lines it took are the header record
+            nonlocal header_size
+            for line in self._read_lines(csv_file):
+                header_size += len(line)
+                yield line.decode(encoding, errors="replace")
+
+        # only the header is read and decoded - invalid characters further into the file don't matter here.
+        # Lines keep their line endings, whether they're \r, \n or \r\n, as the csv reader expects
+        with open(file_path, "rb") as csv_file:
+            reader = csv.reader(header_lines(csv_file), delimiter=delimiter, quotechar=quote_char, escapechar=escape_char)
             original_headers = next(reader)
-        return original_headers
 
-    def _remove_invalid_characters(self, file_path, work_file_prefix):
+        return original_headers, header_size
+
+    @staticmethod
+    def _read_lines(csv_file, block_size=1 << 16):
         """
-        Reads the CSF file and checs/corrects the file for invalid characters
-        :param file_path: path to the CSV file
-        :param work_file: the tempory file
-        :return: worf file name 
+        Reads lines from a binary file, ending in \r, \n or \r\n - as COPY accepts any of them.
+        :param csv_file: file open for binary reading
+        :param block_size: size of the blocks read from the file
+        :return: generator of lines, including their line endings
         """
+        pending = b''
+
+        for block in iter(lambda: csv_file.read(block_size), b''):
+            lines = (pending + block).splitlines(keepends=True)
+
+            # the last line may continue in the next block - and so may a \r followed by \n
+            pending = lines.pop()
 
-        work_file = tempfile.mktemp(".csv", work_file_prefix)
- 
+            for line in lines:
+                yield line
 
-        with open(file_path, "rb") as input:
-           with open(work_file, "wb") as output:
-               while True:
+        if pending:
+            yield pending
 
-                   c = input.read(1)
+    def _remove_invalid_characters(self, file_path, start=0):
+        """
+        Opens the CSV file as a stream that corrects invalid characters as it is read.
+        Correction runs in a separate thread, so it overlaps with the copy to the database.
+        A file without invalid characters is opened as it is.
+        :param file_path: path to the CSV file
+        :param start: offset in bytes the stream starts from, e.g. the size of the header line
+        :return: buffered binary stream of the corrected file
+        """
+        if not self._has_invalid_characters(file_path, start):
+            _LOG.info('No invalid characters found in "{}"'.format(file_path))
+            csv_file = open(file_path, "rb", buffering=self.CHUNK_SIZE)
+            csv_file.seek(start)
+            return csv_file
+
+        return io.BufferedReader(CleaningQueue(file_path, self.CHUNK_SIZE, self.QUEUE_SIZE, start),
+                                 buffer_size=self.CHUNK_SIZE)
+
+    def _has_invalid_characters(self, file_path, start=0):
+        """
+        Checks the CSV file for invalid characters (0xc9 or 0x00 bytes), searching the memory mapped file.
+        :param file_path: path to the CSV file
+        :param start: offset in bytes the search starts from
+        :return: True if the file needs correcting
+        """
+        with open(file_path, "rb") as csv_file:
+            size = os.fstat(csv_file.fileno()).st_size
 
-                   if not c:
-                       break;
+            # an empty file can't be mapped - and has nothing to correct
+            if size <= start:
+                return False
 
-                   elif c == b'\xc9':
-                       logging.getLogger('CsvLoader').info("Found Byte - 0xc9 - correct to 'e'")
-                       output.write(b'e')
-                   elif c == b'\x00':
-                       logging.getLogger('CsvLoader').info("Found Byte - 0x00 - ignored")
-                   elif c > b'\xff':
-                       logging.getLogger('CsvLoader').warn("Invalid Character: {0} - ignored".format(hex(ord(c))))
-                   else:
-                       output.write(c)
+            with mmap.mmap(csv_file.fileno(), 0, access=mmap.ACCESS_READ) as csv_map:
+                # probe the start of the file first, so a 0x00 byte near the start
+                # doesn't cost a search of the whole file for 0xc9 bytes
+                for end in (min(start + self.PROBE_SIZE, size), size):
+                    if csv_map.find(b'\xc9', start, end) != -1 or csv_map.find(b'\x00', start, end) != -1:
+                        return True
 
-        return work_file
+        return False
 
     def _normalize_headers(self, original_headers):
         """
@@ -133,7 +391,7 @@ class CsvLoader(object):
         :param original_headers: list of CSV columns
         :return: simplified headers
         """
-        headers = [self._simplify_text(header) for header in original_headers]
+        headers = list(CsvLoader._simplify_headers(tuple(original_headers)))
         return headers
 
     def _generate_table_name(self, file_path):
@@ -145,25 +403,44 @@ class CsvLoader(object):
         base = os.path.splitext(os.path.basename(file_path))[0]
         return self._table_prefix + CsvLoader._simplify_text(base)
 
-    def _create_table(self, connection, headers, table_name):
+    def _create_table(self, connection, headers, table_name, unlogged=False):
         """
-        Creates database table.
+        Creates database table, if it doesn't exist.
+        A created table is left uncommitted, so it can be loaded in the same transaction.
         :param connection: open connection
         :param headers: a list of columns
         :param table_name: a table name
+        :param unlogged: if True, the table is created as UNLOGGED
+        :return: True if the table was created
         """
-        columns = ['"{}" {}'.format(column, self.DEFAULT_DATA_TYPE) for column in headers]
-        columns_def = ",".join(columns)
+        data_type = sql.SQL(self.DEFAULT_DATA_TYPE)
+        columns_def = sql.SQL(",").join(sql.SQL("{} {}").format(sql.Identifier(column), data_type)
+                                        for column in headers)
+
+        table = self._table_identifier(table_name)
 
+        # files for the same table are loaded in parallel - the loader creating the table holds the lock
+        # until its copy is committed, the others wait for the table and then append to it concurrently
         cursor = connection.cursor()
-        cursor.execute(self.CREATE_STMT.format(table_name, columns_def))
-        connection.commit()
+        cursor.execute(self.LOCK_STMT, (table.as_string(connection),))
+        cursor.execute(self.EXISTS_STMT, (table.as_string(connection),))
+        exists = cursor.fetchone()[0]
+
+        if exists:
+            connection.commit()
+        else:
+            cursor.execute(self.CREATE_STMT.format(unlogged=sql.SQL("UNLOGGED " if unlogged else ""),
+                                                   table=table, columns=columns_def))
         cursor.close()
 
-    def _copy_from_csv(self, connection, work_file, file_path, table_name, headers, delimiter, quote_char, escape_char, encoding):
+        return not exists
+
+    def _copy_from_csv(self, connection, csv_stream, file_path, table_name, headers, delimiter, quote_char, escape_char, encoding,
+                       freeze=False):
         """
         Copies data from CSV to database.
         :param connection: open connection
+        :param csv_stream: binary stream of the corrected CSV file, closed once copied
         :param file_path: path to a CSV file
         :param table_name: a table name
         :param headers: a list of columns
@@ -172,29 +449,131 @@ class CsvLoader(object):
         such as the delimiter or quotechar, or which contain new-line characters
         :param escape_char: a one-character string used by the writer to escape the delimiter
         :param encoding file encoding
+        :param freeze: if True, rows are copied frozen - only valid if the table was created in this transaction
         """
-        columns = ['"{}"'.format(column) for column in headers]
-        columns_def = ",".join(columns)
+        columns_def = sql.SQL(",").join(sql.Identifier(column) for column in headers)
 
         copy_from_escape_char = escape_char or quote_char  # use quote if escape is None
-        command = self.COPY_STMT.format(table_name, columns_def, delimiter,
-                                        quote_char, copy_from_escape_char)
+        command = self.COPY_STMT.format(table=self._table_identifier(table_name), columns=columns_def,
+                                        delimiter=sql.Literal(delimiter), quote=sql.Literal(quote_char),
+                                        escape=sql.Literal(copy_from_escape_char),
+                                        freeze=sql.SQL(", FREEZE" if freeze else ""))
         # https://www.postgresql.org/docs/current/static/sql-copy.html
 
-        print("Started copy : {0} - '{1}' - [{2}] - '{3}'".format(table_name, file_path, delimiter, work_file))
+        print("Started copy : {0} - '{1}' - [{2}]".format(table_name, file_path, delimiter))
 
         cursor = connection.cursor()
-        with open(work_file, "r", encoding=encoding) as csv_file:
-            cursor.copy_expert(command, csv_file)
+        with io.TextIOWrapper(csv_stream, encoding=encoding) as csv_file:
+            cursor.copy_expert(command, csv_file, size=self.CHUNK_SIZE)
             connection.commit()
 
         print("Completed copy : {0} - {1}".format(table_name, file_path))
 
+    def _create_typed_table(self, connection, headers, types, table_name, unlogged=False):
+        """
+        Creates database table with typed columns, if it doesn't exist, using a psycopg 3 connection.
+        :param connection: open psycopg 3 connection
+        :param headers: a list of columns
+        :param types: a list of column types
+        :param table_name: a table name
+        :param unlogged: if True, the table is created as UNLOGGED
+        """
+        columns_def = psycopg.sql.SQL(",").join(
+            psycopg.sql.SQL("{} {}").format(psycopg.sql.Identifier(column), psycopg.sql.SQL(data_type))
+            for column, data_type in zip(headers, types))
+
+        command = psycopg.sql.SQL(self.CREATE_STMT.string).format(
+            unlogged=psycopg.sql.SQL("UNLOGGED " if unlogged else ""),
+            table=psycopg.sql.Identifier(*table_name.split(".")), columns=columns_def)
+
+        with connection.cursor() as cursor:
+            cursor.execute(command)
+        connection.commit()
+
+    def _copy_binary_from_csv(self, connection, csv_stream, file_path, table_name, headers, types, delimiter,
+                              quote_char, escape_char, encoding):
+        """
+        Copies data from CSV to database using binary COPY.
+        :param connection: open psycopg 3 connection
+        :param csv_stream: binary stream of the corrected CSV file, closed once copied
+        :param file_path: path to a CSV file
+        :param table_name: a table name
+        :param headers: a list of columns
+        :param types: a list of column types, as returned by _binary_copy_type
+        :param delimiter: a one-character string used to separate fields. It defaults to ','
+        :param quote_char: a one-character string used to quote fields containing special characters,
+        such as the delimiter or quotechar, or which contain new-line characters
+        :param escape_char: a one-character string used by the writer to escape the delimiter
+        :param encoding file encoding
+        """
+        converters = [self._BINARY_CONVERTERS[data_type] for data_type in types]
+
+        command = psycopg.sql.SQL(self.COPY_BINARY_STMT).format(
+            table=psycopg.sql.Identifier(*table_name.split(".")),
+            columns=psycopg.sql.SQL(",").join(psycopg.sql.Identifier(column) for column in headers))
+
+        print("Started binary copy : {0} - '{1}' - [{2}]".format(table_name, file_path, delimiter))
+
+        with io.TextIOWrapper(csv_stream, encoding=encoding, errors="replace", newline="") as csv_file:
+            reader = csv.reader(csv_file, delimiter=delimiter, quotechar=quote_char, escapechar=escape_char)
+
+            with connection.cursor() as cursor:
+                with cursor.copy(command) as copy:
+                    copy.set_types(types)
+
+                    # empty values are NULL - quoted empty values ("") too, unlike a CSV COPY (see load_data_binary)
+                    for row in reader:
+                        # as strict as a CSV COPY - a missing or extra value must fail the copy, not shift or drop values
+                        if len(row) != len(headers):
+                            raise ValueError("Line {0} of '{1}' has {2} values - expected {3}"
+                                             .format(reader.line_num + 1, file_path, len(row), len(headers)))
+
+                        copy.write_row([convert(value) if value else None for convert, value in zip(converters, row)])
+            connection.commit()
+
+        print("Completed binary copy : {0} - {1}".format(table_name, file_path))
+
+    @classmethod
+    def _binary_copy_type(cls, data_type):
+        """
+        Provides the psycopg 3 type name used to send a column with binary COPY.
+        Type modifiers are removed, e.g. numeric(10,8) -> numeric, character varying(15) -> varchar.
+        :param data_type: a Postgres column type
+        :return: type name in the psycopg 3 types registry
+        """
+        base_type = " ".join(re.sub(r"\(.*?\)", " ", data_type).lower().split())
+        copy_type = cls._BINARY_TYPE_NAMES.get(base_type)
+
+        if copy_type not in cls._BINARY_CONVERTERS:
+            raise ValueError("Column type '{0}' isn't supported by binary COPY - supported types are: {1}"
+                             .format(data_type, ", ".join(sorted(cls._BINARY_TYPE_NAMES))))
+        return copy_type
+
+    @staticmethod
+    def _table_identifier(table_name):
+        """
+        Quotes a table name, optionally qualified with a schema name (e.g. raw_gnaf.address_detail).
+        :param table_name: a table name
+        :return: composable table identifier
+        """
+        return sql.SQL(".").join(sql.Identifier(name) for name in table_name.split("."))
+
     def _create_index(self, original_header):
         # TODO: implement indexing
         pass
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _simplify_headers(original_headers):
+        """
+        Simplifies a header row - the files of each GNAF table (one per state) share the same header.
+        :param original_headers: tuple of CSV columns
+        :return: tuple of simplified headers
+        """
+        return tuple(CsvLoader._simplify_text(header) for header in original_headers)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
     def _simplify_text(text):
         """
         Simplifies text:
@@ -205,11 +584,205 @@ class CsvLoader(object):
         """
         # replace <letter in uppercase> with <letter in lowercase prefixed by underscore>)
         # e.g. SimpleText -> _simple_text
+        unified = CsvLoader._CAMEL.sub(r'\1_\2', text)
+
         # replace all special characters with underscore
-        unified = re.sub('[^0-9a-zA-Z]+', '_', text).lower()
+        unified = CsvLoader._NON_ALNUM.sub('_', unified).lower()
 
         # remove underscore at the beginning
         if unified.startswith("_"):
             unified = unified[1:]
         return unified
 
+
+class CleaningReader(io.RawIOBase):
+    """
+    Raw stream over a CSV file that corrects invalid characters while the file is read,
+    so the corrected data can be copied to the database without writing a work file.
+    The file is memory mapped, so blocks are corrected straight from the page cache:
+    - 0xc9 bytes are corrected to 'e'
+    - 0x00 bytes are ignored
+    """
+
+    def __init__(self, file_path, chunk_size=CsvLoader.CHUNK_SIZE, start=0):
+        """
+        Opens and memory maps the CSV file for reading.
+        :param file_path: path to the CSV file
+        :param chunk_size: size of the blocks read from the CSV file
+        :param start: offset in bytes reading starts from
+        """
+        super().__init__()
+        self._file_path = file_path
+        self._chunk_size = chunk_size
+        self._position = start
+        self._mmap = None
+        self._fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+
+        try:
+            # an empty file can't be mapped - it is simply read as the end of the file
+            if os.fstat(self._fd).st_size > 0:
+                self._mmap = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)
+
+                # hint the kernel to read ahead as the file is read sequentially (Python 3.8+)
+                if hasattr(self._mmap, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+        except Exception:
+            os.close(self._fd)
+            raise
+
+        # corrected data not yet returned to the reader - deleting 0x00 bytes means
+        # a corrected block rarely matches the size of the caller's buffer
+        self._pending = b''
+        self._offset = 0
+        self.corrected = 0
+        self.ignored = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        """
+        Fills the buffer with corrected data.
+        :param buffer: writable buffer
+        :return: number of bytes read, 0 at the end of the file
+        """
+        if self._offset >= len(self._pending):
+            self._pending = self.read_block()
+            self._offset = 0
+
+        size = min(len(buffer), len(self._pending) - self._offset)
+        buffer[:size] = memoryview(self._pending)[self._offset:self._offset + size]
+        self._offset += size
+
+        return size
+
+    def read_block(self):
+        """
+        Reads and corrects the next block of the CSV file.
+        :return: corrected block, empty at the end of the file
+        """
+        while self._mmap is not None and self._position < len(self._mmap):
+            chunk = self._mmap[self._position:self._position + self._chunk_size]
+            self._position += len(chunk)
+
+            corrected = chunk.count(b'\xc9')
+            ignored = chunk.count(b'\x00')
+            self.corrected += corrected
+            self.ignored += ignored
+
+            if (corrected or ignored) and _LOG.isEnabledFor(logging.DEBUG):
+                _LOG.debug("Corrected %d bytes - 0xc9 - to 'e', ignored %d bytes - 0x00 - at offset %d of '%s'",
+                           corrected, ignored, self._position - len(chunk), self._file_path)
+            block = chunk.translate(CsvLoader._TRANSLATE, delete=b'\x00')
+
+            # a block of nothing but 0x00 bytes corrects to nothing - it isn't the end of the file
+            if block:
+                return block
+
+        return b''
+
+    def close(self):
+        if not self.closed:
+            try:
+                if self._mmap is not None:
+                    self._mmap.close()
+            finally:
+                os.close(self._fd)
+
+            _LOG.info("Corrected %d bytes - 0xc9 - to 'e', ignored %d bytes - 0x00 - in '%s'",
+                      self.corrected, self.ignored, self._file_path)
+        super().close()
+
+
+class CleaningQueue(io.RawIOBase):
+    """
+    Raw stream of the corrected contents of a CSV file, produced by a thread into a bounded queue.
+    The database connection releases the GIL while it sends data, so correcting the next
+    blocks overlaps with copying the previous ones, and at most queue_size blocks are held in memory.
+    """
+
+    def __init__(self, file_path, chunk_size=CsvLoader.CHUNK_SIZE, queue_size=CsvLoader.QUEUE_SIZE, start=0):
+        """
+        Starts correcting the CSV file into the queue.
+        :param file_path: path to the CSV file
+        :param chunk_size: size of the blocks read from the CSV file
+        :param queue_size: number of corrected blocks queued ahead of the reader
+        :param start: offset in bytes reading starts from
+        """
+        super().__init__()
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._stopped = threading.Event()
+        self._finished = False
+        self._pending = b''
+        self._offset = 0
+        self._thread = threading.Thread(target=self._produce, args=(file_path, chunk_size, start), daemon=True)
+        self._thread.start()
+
+    def _produce(self, file_path, chunk_size, start):
+        """
+        Queues the corrected blocks of the CSV file, followed by None at the end of the file.
+        :param file_path: path to the CSV file
+        :param chunk_size: size of the blocks read from the CSV file
+        :param start: offset in bytes reading starts from
+        """
+        try:
+            with CleaningReader(file_path, chunk_size, start) as csv_reader:
+                for block in iter(csv_reader.read_block, b''):
+                    if not self._put(block):
+                        return
+            self._put(None)
+        except Exception as ex:
+            # raised to the reader in place of the next block - a truncated file must fail the copy
+            self._put(ex)
+
+    def _put(self, item):
+        """
+        Queues an item, waiting for space unless the reader is closed.
+        :param item: corrected block, None or exception
+        :return: False if the reader was closed
+        """
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        """
+        Fills the buffer with corrected data from the queue.
+        :param buffer: writable buffer
+        :return: number of bytes read, 0 at the end of the file
+        """
+        if self._offset >= len(self._pending):
+            if self._finished:
+                return 0
+
+            block = self._queue.get()
+
+            if block is None:
+                self._finished = True
+                return 0
+            if isinstance(block, Exception):
+                self._finished = True
+                raise block
+
+            self._pending = block
+            self._offset = 0
+
+        size = min(len(buffer), len(self._pending) - self._offset)
+        buffer[:size] = memoryview(self._pending)[self._offset:self._offset + size]
+        self._offset += size
+
+        return size
+
+    def close(self):
+        if not self.closed:
+            # stops a producer thread that is still running
+            self._stopped.set()
+            self._thread.join()
+        super().close()
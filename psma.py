@@ -13,13 +13,15 @@ from csvloader import CsvLoader
 
 # takes a list of sql queries or command lines and runs them using multiprocessing
 def load_csv_files(work_list, settings, logger):
+    ordered_list = order_csv_files(work_list)
+
     pool = multiprocessing.Pool(processes=settings['max_concurrent_processes'])
 
     num_jobs = len(work_list)
 
     logger.info("\t- Starting CSV Load - {0}".format(num_jobs))
 
-    results = pool.imap_unordered(run_csv_multiprocessing, [[w, settings] for w in work_list])
+    results = pool.imap_unordered(run_csv_multiprocessing, [[w, settings] for w in ordered_list])
 
     pool.close()
     pool.join()
@@ -35,6 +37,20 @@ def load_csv_files(work_list, settings, logger):
             logger.info(result)
 
  
+# orders CSV files for loading largest first, so the load isn't left waiting on one large file
+# running on a single core while the other processes are idle
+def order_csv_files(work_list):
+    sizes = dict()
+    for w in work_list:
+        # a missing or unreadable file is left to fail on its own when it's loaded - not to stop the whole load
+        try:
+            sizes[w['file_path']] = os.path.getsize(w['file_path'])
+        except OSError:
+            sizes[w['file_path']] = 0
+
+    return sorted(work_list, key=lambda w: sizes[w['file_path']], reverse=True)
+
+
 # takes a list of sql queries or command lines and runs them using multiprocessing
 def multiprocess_list(mp_type, work_list, settings, logger):
     pool = multiprocessing.Pool(processes=settings['max_concurrent_processes'])
@@ -69,7 +85,8 @@ def run_csv_multiprocessing(args):
     csvloader = CsvLoader(settings['pg_connect_string'])
 
     try:
-        csvloader.load_data(fileInfo['file_path'], delimiter='|', table_name=fileInfo['table'], work_file_prefix=settings['work_file_prefix'])
+        csvloader.load_data(fileInfo['file_path'], delimiter='|', table_name=fileInfo['table'], work_file_prefix=settings['work_file_prefix'],
+                            unlogged=settings['unlogged_tables'])
         result = "SUCCESS"
     except Exception as ex:
         result = "CSV FAILED! : {0} : {1} : {2}".format(fileInfo['table'], fileInfo['file_path'], ex)